@@ -1,9 +1,24 @@
 import os
 import re
 import sys
+import time
+from collections import defaultdict, deque
+from dataclasses import dataclass
 from pathlib import Path
-
-from PySide6.QtCore import QEasingCurve, QObject, QPropertyAnimation, QThread, Qt, Signal
+from urllib.parse import urlparse
+
+from PySide6.QtCore import (
+    QAbstractTableModel,
+    QEasingCurve,
+    QModelIndex,
+    QObject,
+    QPropertyAnimation,
+    QRunnable,
+    QThreadPool,
+    QTimer,
+    Qt,
+    Signal,
+)
 from PySide6.QtWidgets import (
     QAbstractItemView,
     QApplication,
@@ -19,8 +34,12 @@ from PySide6.QtWidgets import (
     QPushButton,
     QProgressBar,
     QPlainTextEdit,
-    QTableWidget,
-    QTableWidgetItem,
+    QSpinBox,
+    QStyle,
+    QStyledItemDelegate,
+    QStyleOptionProgressBar,
+    QStyleOptionViewItem,
+    QTableView,
     QVBoxLayout,
     QWidget,
 )
@@ -28,8 +47,16 @@ from yt_dlp import YoutubeDL
 from yt_dlp.utils import DownloadError
 
 
+_FORBIDDEN_CHARS = frozenset('\\/:*?"<>|')
+_SANITIZE_RE = re.compile(r'[\\/:*?"<>|]+')
+
+
 def sanitize_filename(name: str) -> str:
-    return re.sub(r"[\\/:*?\"<>|]+", "_", name).strip() or "video"
+    # Most titles contain none of the forbidden characters; isdisjoint scans
+    # the string in C and lets them skip the regex engine.
+    if _FORBIDDEN_CHARS.isdisjoint(name):
+        return name.strip() or "video"
+    return _SANITIZE_RE.sub("_", name).strip() or "video"
 
 
 QUALITY_PRESETS = {
@@ -51,24 +78,145 @@ QUALITY_PRESETS = {
 }
 
 
-class DownloadWorker(QObject):
-    progress = Signal(float, str)
-    log = Signal(str)
-    finished = Signal(bool, str)
+def _preset_options(preset: dict) -> dict:
+    options = {"format": preset["format"]}
+    if "merge_output_format" in preset:
+        options["merge_output_format"] = preset["merge_output_format"]
+    if "postprocessors" in preset:
+        # yt-dlp copies each postprocessor dict before using it, so the preset
+        # definitions can be shared between downloads without copying.
+        options["postprocessors"] = tuple(preset["postprocessors"])
+    return options
+
+
+_QUALITY_KEYS: tuple[str, ...] = tuple(QUALITY_PRESETS)
+_QUALITY_KEYS_SET = frozenset(_QUALITY_KEYS)
+_DEFAULT_QUALITY = "Best (Video + Audio)"
+
+_OPTS_CACHE: dict[str, dict] = {
+    name: _preset_options(preset) for name, preset in QUALITY_PRESETS.items()
+}
+
+
+def _quality_options(quality_preset: str) -> dict:
+    # Both pipeline stages select formats from the same cached options.
+    return _OPTS_CACHE.get(quality_preset, _OPTS_CACHE[_DEFAULT_QUALITY])
+
+
+DEFAULT_PARALLEL_DOWNLOADS = 3
+INFO_WORKERS = min(8, os.cpu_count() or 4)
+MAX_PARALLEL_DOWNLOADS = 8
+PER_HOST_DOWNLOADS = 2
+DEFAULT_CONCURRENT_FRAGMENTS = 4
+MAX_CONCURRENT_FRAGMENTS = 16
+HTTP_CHUNK_SIZE = 10 << 20
+DOWNLOAD_BUFFER_SIZE = 1 << 20
+DOWNLOAD_RETRIES = 10
+PROGRESS_INTERVAL = 0.1
+LOG_FLUSH_INTERVAL_MS = 50
+PROGRESS_FLUSH_INTERVAL_MS = 100
+LOG_MAX_LINES = 5000
+_MB = 1.0 / (1024 * 1024)
+
+
+class DownloadSignals(QObject):
+    info_ready = Signal(int, object)
+    started = Signal(int)
+    progress = Signal(int, int, str)
+    log = Signal(int, str)
+    finished = Signal(int, bool, str)
+
+
+class InfoWorker(QRunnable):
+    """Resolves a URL's metadata so the download stage can start right away.
+
+    It holds no per-site download slot; the window queues its result until
+    the row's site has one free.
+    """
+
+    def __init__(
+        self,
+        row: int,
+        url: str,
+        signals: DownloadSignals,
+        cookie_file: str = "",
+        quality_preset: str = _DEFAULT_QUALITY,
+    ):
+        super().__init__()
+        self.row = row
+        self.url = url
+        self.signals = signals
+        self.cookie_file = cookie_file
+        self.quality_preset = quality_preset
+        self._cancelled = False
+
+    def cancel(self) -> None:
+        self._cancelled = True
+
+    def run(self) -> None:
+        if self._cancelled:
+            self.signals.finished.emit(self.row, False, "Download canceled.")
+            return
 
+        ydl_opts = {"noplaylist": True, "quiet": True, "no_warnings": True}
+        ydl_opts.update(_quality_options(self.quality_preset))
+        if self.cookie_file:
+            ydl_opts["cookiefile"] = self.cookie_file
+
+        self.signals.log.emit(self.row, "Fetching video info...")
+        try:
+            with YoutubeDL(ydl_opts) as ydl:
+                # Processing resolves the formats, and yt-dlp stores the cookies
+                # the extractor set for each media URL on the format. The
+                # download stage runs its own YoutubeDL, which loads them back
+                # when it re-processes this result (as --load-info-json does).
+                info = YoutubeDL.sanitize_info(
+                    ydl.extract_info(self.url, download=False), remove_private_keys=True
+                )
+                # Sanitising drops "entries", so playlists, carousels and
+                # multi-video posts are downloaded again from their URL.
+        except DownloadError as exc:
+            self.signals.finished.emit(self.row, False, f"Download failed: {exc}")
+            return
+        except Exception as exc:
+            self.signals.finished.emit(self.row, False, f"Error: {exc}")
+            return
+
+        if self._cancelled:
+            self.signals.finished.emit(self.row, False, "Download canceled.")
+            return
+        self.signals.info_ready.emit(self.row, info)
+
+
+class DownloadWorker(QRunnable):
     def __init__(
         self,
+        row: int,
         url: str,
+        info: dict,
+        signals: DownloadSignals,
         output_dir: str,
         cookie_file: str = "",
-        quality_preset: str = "Best (Video + Audio)",
+        quality_preset: str = _DEFAULT_QUALITY,
+        concurrent_fragments: int = DEFAULT_CONCURRENT_FRAGMENTS,
+        dir_exists: bool = False,
+        cookie_checked: bool = False,
     ):
         super().__init__()
+        self.row = row
         self.url = url
+        self.info = info
+        self.signals = signals
         self.output_dir = output_dir
         self.cookie_file = cookie_file
         self.quality_preset = quality_preset
+        self.concurrent_fragments = concurrent_fragments
+        self.dir_exists = dir_exists
+        self.cookie_checked = cookie_checked
         self._cancelled = False
+        self._last_emit = 0.0
+        self._last_pct = -1
+        self._last_status_text = ""
 
     def cancel(self) -> None:
         self._cancelled = True
@@ -79,86 +227,759 @@ class DownloadWorker(QObject):
 
         status = data.get("status", "")
         if status == "downloading":
+            # yt-dlp calls the hook once per read; cap signals to ~10 Hz so the
+            # GUI thread is not flooded with queued events.
+            now = time.monotonic()
             downloaded = data.get("downloaded_bytes", 0)
             total = data.get("total_bytes") or data.get("total_bytes_estimate") or 0
             if total > 0:
                 percent = (downloaded / total) * 100
+                if percent < 100 and now - self._last_emit < PROGRESS_INTERVAL:
+                    return
+                pct_key = int(percent * 10)
+                if pct_key == self._last_pct:
+                    return
+                self._last_emit = now
+                self._last_pct = pct_key
                 speed = data.get("speed")
                 eta = data.get("eta")
                 speed_text = (
-                    f"{speed / 1024 / 1024:.2f} MB/s" if isinstance(speed, (int, float)) else "N/A"
+                    "%.2f MB/s" % (speed * _MB) if isinstance(speed, (int, float)) else "N/A"
                 )
-                eta_text = f"{eta}s" if isinstance(eta, int) else "N/A"
-                self.progress.emit(percent, f"{percent:.1f}% | {speed_text} | ETA: {eta_text}")
-            else:
-                self.progress.emit(0, "Downloading...")
+                eta_text = "%ds" % eta if isinstance(eta, int) else "N/A"
+                status_text = "%.1f%% | %s | ETA: %s" % (percent, speed_text, eta_text)
+                if status_text == self._last_status_text:
+                    return
+                self._last_status_text = status_text
+                # Bars only render whole percents; the text keeps one decimal.
+                self.signals.progress.emit(self.row, int(percent), status_text)
+            elif now - self._last_emit >= PROGRESS_INTERVAL:
+                self._last_emit = now
+                self.signals.progress.emit(self.row, 0, "Downloading...")
         elif status == "finished":
-            self.progress.emit(100, "Download complete, processing file...")
+            self.signals.progress.emit(self.row, 100, "Download complete, processing file...")
 
     def run(self) -> None:
+        if self._cancelled:
+            self.signals.finished.emit(self.row, False, "Download canceled.")
+            return
+
+        self.signals.started.emit(self.row)
         try:
-            os.makedirs(self.output_dir, exist_ok=True)
+            if not self.dir_exists:
+                os.makedirs(self.output_dir, exist_ok=True)
 
             ydl_opts = {
-                "outtmpl": str(Path(self.output_dir) / "%(title)s.%(ext)s"),
+                "outtmpl": os.path.join(self.output_dir, "%(title)s.%(ext)s"),
                 "noplaylist": True,
                 "restrictfilenames": False,
                 "windowsfilenames": True,
                 "progress_hooks": [self._progress_hook],
                 "quiet": True,
                 "no_warnings": True,
+                "concurrent_fragment_downloads": self.concurrent_fragments,
+                "http_chunk_size": HTTP_CHUNK_SIZE,
+                "buffersize": DOWNLOAD_BUFFER_SIZE,
+                "retries": DOWNLOAD_RETRIES,
+                "fragment_retries": DOWNLOAD_RETRIES,
             }
 
-            preset = QUALITY_PRESETS.get(
-                self.quality_preset, QUALITY_PRESETS["Best (Video + Audio)"]
-            )
-            ydl_opts["format"] = preset["format"]
-            if "merge_output_format" in preset:
-                ydl_opts["merge_output_format"] = preset["merge_output_format"]
-            if "postprocessors" in preset:
-                ydl_opts["postprocessors"] = list(preset["postprocessors"])
-
-            self.log.emit(f"Quality: {self.quality_preset}")
-            if self.cookie_file and Path(self.cookie_file).exists():
+            ydl_opts.update(_quality_options(self.quality_preset))
+
+            self.signals.log.emit(self.row, f"Quality: {self.quality_preset}")
+            if self.cookie_file and (self.cookie_checked or os.path.isfile(self.cookie_file)):
                 ydl_opts["cookiefile"] = self.cookie_file
-                self.log.emit("Using cookies file for authenticated download.")
+                self.signals.log.emit(self.row, "Using cookies file for authenticated download.")
 
-            self.log.emit("Fetching video info...")
             with YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(self.url, download=False)
+                info = self.info
                 title = sanitize_filename(info.get("title", "video"))
-                self.log.emit(f"Title: {title}")
-                self.log.emit("Starting download...")
-                ydl.download([self.url])
+                self.signals.log.emit(self.row, f"Title: {title}")
+                self.signals.log.emit(self.row, "Starting download...")
+                if info.get("_type", "video") == "video":
+                    ydl.process_ie_result(info, download=True)
+                else:
+                    ydl.download([self.url])
 
             if self._cancelled:
-                self.finished.emit(False, "Download canceled.")
+                self.signals.finished.emit(self.row, False, "Download canceled.")
                 return
 
-            self.finished.emit(True, "Download completed successfully.")
+            self.signals.finished.emit(self.row, True, "Download completed successfully.")
         except DownloadError as exc:
             if self._cancelled:
-                self.finished.emit(False, "Download canceled.")
+                self.signals.finished.emit(self.row, False, "Download canceled.")
             else:
-                self.finished.emit(False, f"Download failed: {exc}")
+                self.signals.finished.emit(self.row, False, f"Download failed: {exc}")
         except Exception as exc:
-            self.finished.emit(False, f"Error: {exc}")
+            self.signals.finished.emit(self.row, False, f"Error: {exc}")
 
 
-class MainWindow(QMainWindow):
+@dataclass(slots=True)
+class QueueEntry:
+    url: str
+    quality: str
+    status: str = "Queued"
+    progress: int = 0
+    host: str = ""
+
+
+# Attribute lookups on Qt enums are slow in PySide6 and data() runs for
+# every cell and role on each repaint, so the roles it checks are bound once.
+_DISPLAY_ROLE = Qt.DisplayRole
+_EDIT_ROLE = Qt.EditRole
+_TOOLTIP_ROLE = Qt.ToolTipRole
+_ALIGNMENT_ROLE = Qt.TextAlignmentRole
+_ALIGN_CENTER = Qt.AlignCenter
+_EDITABLE = Qt.ItemIsEditable
+_PROGRESS_ROLE = Qt.UserRole
+_DISPLAY_ROLES = [_DISPLAY_ROLE]
+_PROGRESS_ROLES = [_DISPLAY_ROLE, _PROGRESS_ROLE]
+_FINISHED_STATES = frozenset(("Done", "Failed", "Canceled"))
+
+
+class QueueModel(QAbstractTableModel):
     COL_URL = 0
     COL_QUALITY = 1
     COL_STATUS = 2
     COL_PROGRESS = 3
+    HEADERS = ("URL", "Quality", "Status", "Progress")
+
+    def __init__(self, parent: QObject | None = None):
+        super().__init__(parent)
+        self.entries: list[QueueEntry] = []
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.entries)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = _DISPLAY_ROLE):
+        if role == _DISPLAY_ROLE and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index: QModelIndex, role: int = _DISPLAY_ROLE):
+        if not index.isValid():
+            return None
+        entry = self.entries[index.row()]
+        column = index.column()
+        if role == _DISPLAY_ROLE:
+            if column == self.COL_URL:
+                return entry.url
+            if column == self.COL_QUALITY:
+                return entry.quality
+            if column == self.COL_STATUS:
+                return entry.status
+            return f"{entry.progress}%"
+        if role == _PROGRESS_ROLE:
+            return entry.progress
+        if role == _TOOLTIP_ROLE:
+            if column == self.COL_URL:
+                return entry.url
+            if column == self.COL_QUALITY:
+                return "Double-click to change quality"
+        if role == _ALIGNMENT_ROLE and column != self.COL_URL:
+            return _ALIGN_CENTER
+        return None
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlags:
+        flags = super().flags(index)
+        if index.column() == self.COL_QUALITY:
+            flags |= _EDITABLE
+        return flags
+
+    def setData(self, index: QModelIndex, value, role: int = _EDIT_ROLE) -> bool:
+        # Only quality is user-editable; status and progress go through
+        # set_status/set_progress.
+        if not index.isValid() or role != _EDIT_ROLE or index.column() != self.COL_QUALITY:
+            return False
+        self.entries[index.row()].quality = value
+        self.dataChanged.emit(index, index, _DISPLAY_ROLES)
+        return True
+
+    def append_entries(self, entries: list[QueueEntry]) -> None:
+        if not entries:
+            return
+        first = len(self.entries)
+        self.beginInsertRows(QModelIndex(), first, first + len(entries) - 1)
+        self.entries.extend(entries)
+        self.endInsertRows()
+
+    def removeRows(self, row: int, count: int, parent: QModelIndex = QModelIndex()) -> bool:
+        if parent.isValid() or count <= 0 or row < 0 or row + count > len(self.entries):
+            return False
+        self.beginRemoveRows(QModelIndex(), row, row + count - 1)
+        del self.entries[row : row + count]
+        self.endRemoveRows()
+        return True
+
+    # Status and progress change many times per item, so these skip
+    # setData's column dispatch and only touch the one field.
+    def set_status(self, row: int, status: str) -> None:
+        entry = self.entries[row]
+        if entry.status != status:
+            entry.status = status
+            index = self.index(row, self.COL_STATUS)
+            self.dataChanged.emit(index, index, _DISPLAY_ROLES)
+
+    def set_progress(self, row: int, percent: int) -> None:
+        entry = self.entries[row]
+        if entry.progress != percent:
+            entry.progress = percent
+            index = self.index(row, self.COL_PROGRESS)
+            self.dataChanged.emit(index, index, _PROGRESS_ROLES)
+
+
+class QualityDelegate(QStyledItemDelegate):
+    """Edits a row's quality with a combo box that only exists while editing."""
+
+    def __init__(self, parent: QObject | None = None):
+        super().__init__(parent)
+        self.enabled = True
+        self._editor: QComboBox | None = None
+
+    def set_enabled(self, enabled: bool) -> None:
+        self.enabled = enabled
+        # An editor left open when a run starts is dropped without committing.
+        if not enabled and self._editor is not None:
+            self.closeEditor.emit(self._editor)
+
+    def createEditor(self, parent: QWidget, option, index: QModelIndex) -> QWidget | None:
+        if not self.enabled:
+            return None
+        combo = QComboBox(parent)
+        combo.addItems(_QUALITY_KEYS)
+        combo.activated.connect(lambda _index, combo=combo: self._commit(combo))
+        QTimer.singleShot(0, combo, combo.showPopup)
+        self._editor = combo
+        return combo
+
+    def destroyEditor(self, editor: QWidget, index: QModelIndex) -> None:
+        if editor is self._editor:
+            self._editor = None
+        super().destroyEditor(editor, index)
+
+    def setEditorData(self, editor: QWidget, index: QModelIndex) -> None:
+        editor.setCurrentText(index.data())
+
+    def setModelData(self, editor: QWidget, model: QAbstractTableModel, index: QModelIndex) -> None:
+        model.setData(index, editor.currentText())
+
+    def _commit(self, combo: QComboBox) -> None:
+        self.commitData.emit(combo)
+        self.closeEditor.emit(combo)
+
+
+class ProgressDelegate(QStyledItemDelegate):
+    """Paints a row's progress bar from the model instead of a widget per row."""
+
+    def __init__(self, parent: QWidget):
+        super().__init__(parent)
+        # Never shown. Handing it to drawControl makes the stylesheet's
+        # QProgressBar rules apply to the painted bars.
+        self._style_source = QProgressBar(parent)
+        self._style_source.hide()
+
+    def paint(self, painter, option: QStyleOptionViewItem, index: QModelIndex) -> None:
+        widget = option.widget
+        style = widget.style() if widget is not None else QApplication.style()
+
+        # Cell background and selection only; the bar draws the percent text.
+        item = QStyleOptionViewItem(option)
+        self.initStyleOption(item, index)
+        item.text = ""
+        style.drawControl(QStyle.CE_ItemViewItem, item, painter, widget)
+
+        percent = index.data(_PROGRESS_ROLE)
+        bar = QStyleOptionProgressBar()
+        bar.rect = option.rect.adjusted(4, 3, -4, -3)
+        bar.state = QStyle.State_Enabled | QStyle.State_Horizontal
+        bar.minimum = 0
+        bar.maximum = 100
+        bar.progress = percent
+        bar.text = f"{percent}%"
+        bar.textVisible = True
+        bar.textAlignment = _ALIGN_CENTER
+        style.drawControl(QStyle.CE_ProgressBar, bar, painter, self._style_source)
+
+
+_LIGHT_QSS = """
+    QWidget#root {
+        background: qlineargradient(
+            x1: 0, y1: 0, x2: 1, y2: 1,
+            stop: 0 #f4f9ff,
+            stop: 0.55 #fbfcfe,
+            stop: 1 #fff7ed
+        );
+    }
+    QFrame#headerCard, QFrame#card {
+        background-color: rgba(255, 255, 255, 230);
+        border: 1px solid #d9e3f0;
+        border-radius: 16px;
+    }
+    QLabel {
+        color: #233042;
+        font-family: "Trebuchet MS";
+    }
+    QLabel#titleLabel {
+        font-family: "Bahnschrift SemiBold";
+        color: #18283b;
+        font-size: 28px;
+        letter-spacing: 0.4px;
+    }
+    QLabel#subtitleLabel {
+        color: #4f637c;
+        font-size: 14px;
+    }
+    QLabel#fieldLabel {
+        color: #344861;
+        font-size: 12px;
+        font-weight: 600;
+        text-transform: uppercase;
+        letter-spacing: 0.8px;
+    }
+    QLabel#platformChip {
+        border: 1px solid #bfd2ea;
+        background-color: #eff6ff;
+        border-radius: 11px;
+        padding: 3px 10px;
+        color: #214a7a;
+        font-size: 11px;
+        font-weight: 600;
+    }
+    QLineEdit {
+        background: #ffffff;
+        border: 1px solid #c4d4e9;
+        border-radius: 10px;
+        padding: 10px 12px;
+        color: #1f2f45;
+        font-size: 13px;
+        selection-background-color: #5ca7ff;
+    }
+    QLineEdit:focus {
+        border: 2px solid #4c8fe3;
+    }
+    QComboBox {
+        background: #ffffff;
+        border: 1px solid #c4d4e9;
+        border-radius: 10px;
+        padding: 9px 12px;
+        color: #1f2f45;
+        font-size: 13px;
+    }
+    QComboBox::drop-down {
+        border: none;
+        width: 26px;
+    }
+    QSpinBox {
+        background: #ffffff;
+        border: 1px solid #c4d4e9;
+        border-radius: 10px;
+        padding: 8px 10px;
+        color: #1f2f45;
+        font-size: 13px;
+    }
+    QComboBox::down-arrow {
+        width: 0px;
+        height: 0px;
+        border-left: 5px solid transparent;
+        border-right: 5px solid transparent;
+        border-top: 7px solid #4f6f94;
+        margin-right: 8px;
+    }
+    QComboBox QAbstractItemView {
+        border: 1px solid #c4d4e9;
+        background: #ffffff;
+        color: #1f2f45;
+        selection-background-color: #d9ecff;
+        selection-color: #1f2f45;
+        outline: 0;
+    }
+    QComboBox QAbstractItemView::item {
+        background: #ffffff;
+        color: #1f2f45;
+        min-height: 22px;
+        padding: 5px 8px;
+    }
+    QComboBox QAbstractItemView::item:selected {
+        background: #d9ecff;
+        color: #1f2f45;
+    }
+    QPushButton {
+        border-radius: 10px;
+        padding: 9px 14px;
+        font-family: "Trebuchet MS";
+        font-size: 13px;
+        font-weight: 700;
+    }
+    QPushButton#primaryButton {
+        background-color: #1877f2;
+        color: #ffffff;
+        border: 1px solid #156bda;
+    }
+    QPushButton#primaryButton:hover {
+        background-color: #1168d9;
+    }
+    QPushButton#secondaryButton {
+        background-color: #ffffff;
+        color: #27507f;
+        border: 1px solid #b9cce5;
+    }
+    QPushButton#secondaryButton:hover {
+        background-color: #edf4ff;
+    }
+    QPushButton#dangerButton {
+        background-color: #fff4f2;
+        color: #b53a2f;
+        border: 1px solid #f1c3be;
+    }
+    QPushButton#dangerButton:hover {
+        background-color: #ffe7e2;
+    }
+    QPushButton:disabled {
+        background-color: #eef2f7;
+        color: #8ea1b9;
+        border: 1px solid #dde4ed;
+    }
+    QLabel#statusPill {
+        min-width: 170px;
+        border-radius: 13px;
+        padding: 6px 10px;
+        font-size: 12px;
+        font-weight: 700;
+        color: #1f3f66;
+        background-color: #e6f1ff;
+        border: 1px solid #b8d0ec;
+    }
+    QLabel#statusPill[state="active"] {
+        color: #1f3f66;
+        background-color: #dff0ff;
+        border: 1px solid #9fc7ee;
+    }
+    QLabel#statusPill[state="success"] {
+        color: #1f6a3b;
+        background-color: #e8f9ee;
+        border: 1px solid #a6ddb6;
+    }
+    QLabel#statusPill[state="warning"] {
+        color: #8a5a12;
+        background-color: #fff5e5;
+        border: 1px solid #f5d49b;
+    }
+    QLabel#statusPill[state="error"] {
+        color: #8f2720;
+        background-color: #ffe8e5;
+        border: 1px solid #efc0bb;
+    }
+    QProgressBar {
+        border: 1px solid #c7d7eb;
+        border-radius: 10px;
+        height: 22px;
+        background: #edf3fa;
+    }
+    QProgressBar::chunk {
+        border-radius: 9px;
+        background: qlineargradient(
+            x1: 0, y1: 0, x2: 1, y2: 0,
+            stop: 0 #35a6ff, stop: 1 #1570ef
+        );
+    }
+    QPlainTextEdit#logBox {
+        background-color: #f9fbff;
+        border: 1px solid #d2deee;
+        border-radius: 10px;
+        padding: 8px;
+        color: #233042;
+        font-family: "Consolas";
+        font-size: 12px;
+    }
+    QTableView {
+        background-color: #ffffff;
+        border: 1px solid #d2deee;
+        border-radius: 10px;
+        gridline-color: #e2eaf5;
+        alternate-background-color: #f8fbff;
+        selection-background-color: #d9ecff;
+        selection-color: #1f2f45;
+        color: #233042;
+        font-size: 12px;
+    }
+    QHeaderView::section {
+        background: #eef4fc;
+        color: #365070;
+        border: none;
+        border-right: 1px solid #d7e2f0;
+        border-bottom: 1px solid #d7e2f0;
+        padding: 8px;
+        font-weight: 700;
+    }
+    QTableView QScrollBar:vertical {
+        background: #eef4fc;
+        width: 12px;
+        border-radius: 6px;
+        margin: 4px;
+    }
+    QTableView QScrollBar::handle:vertical {
+        background: #b8cbe4;
+        border-radius: 6px;
+        min-height: 24px;
+    }
+    QTableView QScrollBar:horizontal {
+        background: #eef4fc;
+        height: 12px;
+        border-radius: 6px;
+        margin: 4px;
+    }
+    QTableView QScrollBar::handle:horizontal {
+        background: #b8cbe4;
+        border-radius: 6px;
+        min-width: 24px;
+    }
+    QTableView QScrollBar::add-line,
+    QTableView QScrollBar::sub-line {
+        width: 0px;
+        height: 0px;
+        border: none;
+        background: transparent;
+    }
+"""
+
+_DARK_QSS = _LIGHT_QSS + """
+    QWidget#root {
+        background: qlineargradient(
+            x1: 0, y1: 0, x2: 1, y2: 1,
+            stop: 0 #131a25,
+            stop: 0.55 #161f2d,
+            stop: 1 #1c2434
+        );
+    }
+    QFrame#headerCard, QFrame#card {
+        background-color: rgba(25, 34, 49, 232);
+        border: 1px solid #33445f;
+    }
+    QLabel {
+        color: #d4e3f8;
+    }
+    QLabel#titleLabel {
+        color: #ecf3ff;
+    }
+    QLabel#subtitleLabel {
+        color: #9eb3d3;
+    }
+    QLabel#fieldLabel {
+        color: #95abcf;
+    }
+    QLabel#platformChip {
+        border: 1px solid #3e5580;
+        background-color: #22314b;
+        color: #c5d9f7;
+    }
+    QLineEdit {
+        background: #1a2537;
+        border: 1px solid #3a4d70;
+        color: #d7e5fb;
+        selection-background-color: #2f71c8;
+    }
+    QLineEdit:focus {
+        border: 2px solid #4b8be1;
+    }
+    QComboBox {
+        background: #1a2537;
+        border: 1px solid #3a4d70;
+        color: #d7e5fb;
+    }
+    QComboBox::down-arrow {
+        border-top: 7px solid #9ab7de;
+    }
+    QSpinBox {
+        background: #1a2537;
+        border: 1px solid #3a4d70;
+        color: #d7e5fb;
+    }
+    QComboBox QAbstractItemView {
+        border: 1px solid #3a4d70;
+        background: #1a2537;
+        color: #d7e5fb;
+        selection-background-color: #2b4872;
+        selection-color: #eaf3ff;
+    }
+    QComboBox QAbstractItemView::item {
+        background: #1a2537;
+        color: #d7e5fb;
+    }
+    QComboBox QAbstractItemView::item:selected {
+        background: #2b4872;
+        color: #eaf3ff;
+    }
+    QPushButton#primaryButton {
+        background-color: #2f6fd8;
+        color: #edf4ff;
+        border: 1px solid #245ebd;
+    }
+    QPushButton#primaryButton:hover {
+        background-color: #2866cb;
+    }
+    QPushButton#secondaryButton {
+        background-color: #1f2a3d;
+        color: #c6daf8;
+        border: 1px solid #3d5479;
+    }
+    QPushButton#secondaryButton:hover {
+        background-color: #24334a;
+    }
+    QPushButton#secondaryButton:checked {
+        background-color: #2a3f63;
+        color: #e7f0ff;
+        border: 1px solid #5781c2;
+    }
+    QPushButton#dangerButton {
+        background-color: #3a2227;
+        color: #ffb8b2;
+        border: 1px solid #774047;
+    }
+    QPushButton#dangerButton:hover {
+        background-color: #46282e;
+    }
+    QPushButton:disabled {
+        background-color: #1a2434;
+        color: #70839f;
+        border: 1px solid #2f3f57;
+    }
+    QLabel#statusPill {
+        color: #cde1ff;
+        background-color: #1f3553;
+        border: 1px solid #42638d;
+    }
+    QLabel#statusPill[state="active"] {
+        color: #cde1ff;
+        background-color: #22405f;
+        border: 1px solid #4d78a9;
+    }
+    QLabel#statusPill[state="success"] {
+        color: #c8f4d8;
+        background-color: #1e4733;
+        border: 1px solid #3e7a5e;
+    }
+    QLabel#statusPill[state="warning"] {
+        color: #ffe0b4;
+        background-color: #4d3a1f;
+        border: 1px solid #816637;
+    }
+    QLabel#statusPill[state="error"] {
+        color: #ffc8c2;
+        background-color: #54272b;
+        border: 1px solid #87454c;
+    }
+    QProgressBar {
+        border: 1px solid #415474;
+        background: #182234;
+    }
+    QProgressBar::chunk {
+        background: qlineargradient(
+            x1: 0, y1: 0, x2: 1, y2: 0,
+            stop: 0 #3ea8ff, stop: 1 #2f73db
+        );
+    }
+    QPlainTextEdit#logBox {
+        background-color: #172132;
+        border: 1px solid #374a68;
+        color: #d7e5fb;
+    }
+    QTableView {
+        background-color: #162131;
+        border: 1px solid #374a68;
+        gridline-color: #2e3f59;
+        alternate-background-color: #1a2739;
+        selection-background-color: #2b4872;
+        selection-color: #eaf3ff;
+        color: #d7e5fb;
+    }
+    QHeaderView::section {
+        background: #25344b;
+        color: #cde1ff;
+        border-right: 1px solid #374a68;
+        border-bottom: 1px solid #374a68;
+    }
+    QTableView QScrollBar:vertical {
+        background: #1d2b40;
+    }
+    QTableView QScrollBar::handle:vertical {
+        background: #4c658e;
+    }
+    QTableView QScrollBar:horizontal {
+        background: #1d2b40;
+    }
+    QTableView QScrollBar::handle:horizontal {
+        background: #4c658e;
+    }
+"""
+
+
+class MainWindow(QMainWindow):
+    # Queue items never get a thread of their own. Both pools start threads
+    # lazily, only as many as items are in flight, and keep them parked once
+    # idle. A one-URL queue therefore runs on one info thread and one download
+    # thread, and later runs reuse them instead of paying for thread start-up
+    # again.
+    COL_URL = QueueModel.COL_URL
+    COL_QUALITY = QueueModel.COL_QUALITY
+    COL_STATUS = QueueModel.COL_STATUS
+    COL_PROGRESS = QueueModel.COL_PROGRESS
 
     def __init__(self) -> None:
         super().__init__()
         self.setWindowTitle("Universal Video Downloader")
         self.resize(980, 720)
 
-        self.thread: QThread | None = None
-        self.worker: DownloadWorker | None = None
-        self.current_row: int | None = None
+        # Two-stage pipeline: metadata extraction is cheap and runs wide on
+        # info_pool, while bandwidth-bound downloads are limited on pool.
+        self.info_pool = QThreadPool(self)
+        self.info_pool.setMaxThreadCount(INFO_WORKERS)
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(DEFAULT_PARALLEL_DOWNLOADS)
+        for pool in (self.info_pool, self.pool):
+            pool.setExpiryTimeout(-1)
+        # None marks a row whose info is ready and that waits for a download
+        # slot on its site.
+        self.active_workers: dict[int, InfoWorker | DownloadWorker | None] = {}
+        # Every signal carries its row, so all workers share one emitter that
+        # is wired up once instead of per item.
+        self.worker_signals = DownloadSignals(self)
+        self._connect_worker(self.worker_signals)
+        self._job: dict = {}
+        # Per-host limits are counted on the GUI thread and checked before an
+        # item is handed to a pool, so no pool thread ever blocks waiting for
+        # a busy site. Only the download stage holds a site slot; extracted
+        # items wait in _ready until one frees up.
+        self._host_extracting: defaultdict[str, int] = defaultdict(int)
+        self._host_downloading: defaultdict[str, int] = defaultdict(int)
+        self._ready: defaultdict[str, deque[tuple[int, dict]]] = defaultdict(deque)
+        self._batch_progress: dict[int, float] = {}
+        # "Item N" labels for rows in the current run, built once per item.
+        self._status_prefix: dict[int, str] = {}
+        self._log_prefix: dict[int, str] = {}
+        self._validated_dirs: set[str] = set()
+        self._validated_cookies: dict[str, bool] = {}
+        self._queued_urls: set[str] = set()
+        self._pending_rows: deque[int] = deque()
+        self._log_buffer: deque[str] = deque()
+        self._log_timer = QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(LOG_FLUSH_INTERVAL_MS)
+        self._log_timer.timeout.connect(self._flush_log)
+        self._buttons_timer = QTimer(self)
+        self._buttons_timer.setSingleShot(True)
+        self._buttons_timer.setInterval(0)
+        self._buttons_timer.timeout.connect(self._update_queue_buttons_now)
+        self._pending_progress: dict[int, int] = {}
+        self._last_bar_value = 0
+        self._pending_status: tuple[int, str] | None = None
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(PROGRESS_FLUSH_INTERVAL_MS)
+        self._progress_timer.timeout.connect(self._flush_progress)
         self.queue_running = False
         self.stop_queue_requested = False
         self.dark_mode = True
@@ -173,8 +994,25 @@ class MainWindow(QMainWindow):
         )
 
         self.quality_combo = QComboBox()
-        self.quality_combo.addItems(list(QUALITY_PRESETS.keys()))
-        self.quality_combo.setCurrentText("Best (Video + Audio)")
+        self.quality_combo.addItems(_QUALITY_KEYS)
+        self.quality_combo.setCurrentText(_DEFAULT_QUALITY)
+
+        self.parallel_spin = QSpinBox()
+        self.parallel_spin.setRange(1, MAX_PARALLEL_DOWNLOADS)
+        self.parallel_spin.setValue(DEFAULT_PARALLEL_DOWNLOADS)
+        self.parallel_spin.setToolTip("Maximum number of downloads running at the same time")
+        self.parallel_spin.valueChanged.connect(self.pool.setMaxThreadCount)
+
+        self.per_site_spin = QSpinBox()
+        self.per_site_spin.setRange(1, MAX_PARALLEL_DOWNLOADS)
+        self.per_site_spin.setValue(PER_HOST_DOWNLOADS)
+        self.per_site_spin.setToolTip("Maximum number of downloads from the same site at the same time")
+        self.per_site_spin.valueChanged.connect(self._on_per_site_changed)
+
+        self.fragments_spin = QSpinBox()
+        self.fragments_spin.setRange(1, MAX_CONCURRENT_FRAGMENTS)
+        self.fragments_spin.setValue(DEFAULT_CONCURRENT_FRAGMENTS)
+        self.fragments_spin.setToolTip("Fragments fetched in parallel for HLS/DASH streams")
 
         self.output_input = QLineEdit(str(Path.home() / "Downloads"))
         self.output_input.setClearButtonEnabled(True)
@@ -226,18 +1064,29 @@ class MainWindow(QMainWindow):
         self.status_label = QLabel("Ready")
         self.status_label.setObjectName("statusPill")
         self.status_label.setProperty("state", "idle")
+        self._last_status_text = "Ready"
+        self._last_status_state = "idle"
         self.status_label.setAlignment(Qt.AlignCenter)
 
         self.log_box = QPlainTextEdit()
         self.log_box.setObjectName("logBox")
         self.log_box.setReadOnly(True)
+        self.log_box.setUndoRedoEnabled(False)
+        self.log_box.setMaximumBlockCount(LOG_MAX_LINES)
         self.log_box.setPlaceholderText("Download events will appear here...")
 
-        self.queue_table = QTableWidget(0, 4)
-        self.queue_table.setHorizontalHeaderLabels(["URL", "Quality", "Status", "Progress"])
+        self.queue_model = QueueModel(self)
+        self.queue_table = QTableView()
+        self.queue_table.setModel(self.queue_model)
         self.queue_table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.queue_table.setSelectionMode(QAbstractItemView.ExtendedSelection)
-        self.queue_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.queue_table.setEditTriggers(
+            QAbstractItemView.DoubleClicked | QAbstractItemView.EditKeyPressed
+        )
+        self.quality_delegate = QualityDelegate(self.queue_table)
+        self.queue_table.setItemDelegateForColumn(self.COL_QUALITY, self.quality_delegate)
+        self.progress_delegate = ProgressDelegate(self.queue_table)
+        self.queue_table.setItemDelegateForColumn(self.COL_PROGRESS, self.progress_delegate)
         self.queue_table.setHorizontalScrollMode(QAbstractItemView.ScrollPerPixel)
         self.queue_table.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
         self.queue_table.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
@@ -247,12 +1096,16 @@ class MainWindow(QMainWindow):
         self.queue_table.setAlternatingRowColors(True)
         self.queue_table.verticalHeader().setVisible(False)
         header = self.queue_table.horizontalHeader()
-        header.setSectionResizeMode(self.COL_URL, QHeaderView.Interactive)
-        header.setSectionResizeMode(self.COL_QUALITY, QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(self.COL_STATUS, QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(self.COL_PROGRESS, QHeaderView.ResizeToContents)
-        self.queue_table.setColumnWidth(self.COL_URL, 540)
-        self.queue_table.itemSelectionChanged.connect(self._update_queue_buttons)
+        header.setSectionResizeMode(self.COL_URL, QHeaderView.Stretch)
+        # Fixed widths: ResizeToContents would re-measure every row of the
+        # column each time a status or progress cell changes.
+        header.setSectionResizeMode(self.COL_QUALITY, QHeaderView.Fixed)
+        header.setSectionResizeMode(self.COL_STATUS, QHeaderView.Fixed)
+        header.setSectionResizeMode(self.COL_PROGRESS, QHeaderView.Fixed)
+        self.queue_table.setColumnWidth(self.COL_QUALITY, 200)
+        self.queue_table.setColumnWidth(self.COL_STATUS, 120)
+        self.queue_table.setColumnWidth(self.COL_PROGRESS, 140)
+        self.queue_table.selectionModel().selectionChanged.connect(self._update_queue_buttons)
 
         central = QWidget(objectName="root")
         main_layout = QVBoxLayout(central)
@@ -295,7 +1148,17 @@ class MainWindow(QMainWindow):
         input_layout.addWidget(QLabel("Video URL", objectName="fieldLabel"))
         input_layout.addWidget(self.url_input)
         input_layout.addWidget(QLabel("Quality / Format", objectName="fieldLabel"))
-        input_layout.addWidget(self.quality_combo)
+
+        quality_layout = QHBoxLayout()
+        quality_layout.setSpacing(8)
+        quality_layout.addWidget(self.quality_combo, 1)
+        quality_layout.addWidget(QLabel("Parallel", objectName="fieldLabel"))
+        quality_layout.addWidget(self.parallel_spin)
+        quality_layout.addWidget(QLabel("Per site", objectName="fieldLabel"))
+        quality_layout.addWidget(self.per_site_spin)
+        quality_layout.addWidget(QLabel("Fragments", objectName="fieldLabel"))
+        quality_layout.addWidget(self.fragments_spin)
+        input_layout.addLayout(quality_layout)
         input_layout.addWidget(QLabel("Save To", objectName="fieldLabel"))
 
         folder_layout = QHBoxLayout()
@@ -370,406 +1233,7 @@ class MainWindow(QMainWindow):
         return chip
 
     def apply_styles(self) -> None:
-        base_styles = """
-            QWidget#root {
-                background: qlineargradient(
-                    x1: 0, y1: 0, x2: 1, y2: 1,
-                    stop: 0 #f4f9ff,
-                    stop: 0.55 #fbfcfe,
-                    stop: 1 #fff7ed
-                );
-            }
-            QFrame#headerCard, QFrame#card {
-                background-color: rgba(255, 255, 255, 230);
-                border: 1px solid #d9e3f0;
-                border-radius: 16px;
-            }
-            QLabel {
-                color: #233042;
-                font-family: "Trebuchet MS";
-            }
-            QLabel#titleLabel {
-                font-family: "Bahnschrift SemiBold";
-                color: #18283b;
-                font-size: 28px;
-                letter-spacing: 0.4px;
-            }
-            QLabel#subtitleLabel {
-                color: #4f637c;
-                font-size: 14px;
-            }
-            QLabel#fieldLabel {
-                color: #344861;
-                font-size: 12px;
-                font-weight: 600;
-                text-transform: uppercase;
-                letter-spacing: 0.8px;
-            }
-            QLabel#platformChip {
-                border: 1px solid #bfd2ea;
-                background-color: #eff6ff;
-                border-radius: 11px;
-                padding: 3px 10px;
-                color: #214a7a;
-                font-size: 11px;
-                font-weight: 600;
-            }
-            QLineEdit {
-                background: #ffffff;
-                border: 1px solid #c4d4e9;
-                border-radius: 10px;
-                padding: 10px 12px;
-                color: #1f2f45;
-                font-size: 13px;
-                selection-background-color: #5ca7ff;
-            }
-            QLineEdit:focus {
-                border: 2px solid #4c8fe3;
-            }
-            QComboBox {
-                background: #ffffff;
-                border: 1px solid #c4d4e9;
-                border-radius: 10px;
-                padding: 9px 12px;
-                color: #1f2f45;
-                font-size: 13px;
-            }
-            QComboBox::drop-down {
-                border: none;
-                width: 26px;
-            }
-            QComboBox::down-arrow {
-                width: 0px;
-                height: 0px;
-                border-left: 5px solid transparent;
-                border-right: 5px solid transparent;
-                border-top: 7px solid #4f6f94;
-                margin-right: 8px;
-            }
-            QComboBox QAbstractItemView {
-                border: 1px solid #c4d4e9;
-                background: #ffffff;
-                color: #1f2f45;
-                selection-background-color: #d9ecff;
-                selection-color: #1f2f45;
-                outline: 0;
-            }
-            QComboBox QAbstractItemView::item {
-                background: #ffffff;
-                color: #1f2f45;
-                min-height: 22px;
-                padding: 5px 8px;
-            }
-            QComboBox QAbstractItemView::item:selected {
-                background: #d9ecff;
-                color: #1f2f45;
-            }
-            QPushButton {
-                border-radius: 10px;
-                padding: 9px 14px;
-                font-family: "Trebuchet MS";
-                font-size: 13px;
-                font-weight: 700;
-            }
-            QPushButton#primaryButton {
-                background-color: #1877f2;
-                color: #ffffff;
-                border: 1px solid #156bda;
-            }
-            QPushButton#primaryButton:hover {
-                background-color: #1168d9;
-            }
-            QPushButton#secondaryButton {
-                background-color: #ffffff;
-                color: #27507f;
-                border: 1px solid #b9cce5;
-            }
-            QPushButton#secondaryButton:hover {
-                background-color: #edf4ff;
-            }
-            QPushButton#dangerButton {
-                background-color: #fff4f2;
-                color: #b53a2f;
-                border: 1px solid #f1c3be;
-            }
-            QPushButton#dangerButton:hover {
-                background-color: #ffe7e2;
-            }
-            QPushButton:disabled {
-                background-color: #eef2f7;
-                color: #8ea1b9;
-                border: 1px solid #dde4ed;
-            }
-            QLabel#statusPill {
-                min-width: 170px;
-                border-radius: 13px;
-                padding: 6px 10px;
-                font-size: 12px;
-                font-weight: 700;
-                color: #1f3f66;
-                background-color: #e6f1ff;
-                border: 1px solid #b8d0ec;
-            }
-            QLabel#statusPill[state="active"] {
-                color: #1f3f66;
-                background-color: #dff0ff;
-                border: 1px solid #9fc7ee;
-            }
-            QLabel#statusPill[state="success"] {
-                color: #1f6a3b;
-                background-color: #e8f9ee;
-                border: 1px solid #a6ddb6;
-            }
-            QLabel#statusPill[state="warning"] {
-                color: #8a5a12;
-                background-color: #fff5e5;
-                border: 1px solid #f5d49b;
-            }
-            QLabel#statusPill[state="error"] {
-                color: #8f2720;
-                background-color: #ffe8e5;
-                border: 1px solid #efc0bb;
-            }
-            QProgressBar {
-                border: 1px solid #c7d7eb;
-                border-radius: 10px;
-                height: 22px;
-                background: #edf3fa;
-            }
-            QProgressBar::chunk {
-                border-radius: 9px;
-                background: qlineargradient(
-                    x1: 0, y1: 0, x2: 1, y2: 0,
-                    stop: 0 #35a6ff, stop: 1 #1570ef
-                );
-            }
-            QPlainTextEdit#logBox {
-                background-color: #f9fbff;
-                border: 1px solid #d2deee;
-                border-radius: 10px;
-                padding: 8px;
-                color: #233042;
-                font-family: "Consolas";
-                font-size: 12px;
-            }
-            QTableWidget {
-                background-color: #ffffff;
-                border: 1px solid #d2deee;
-                border-radius: 10px;
-                gridline-color: #e2eaf5;
-                alternate-background-color: #f8fbff;
-                selection-background-color: #d9ecff;
-                selection-color: #1f2f45;
-                color: #233042;
-                font-size: 12px;
-            }
-            QHeaderView::section {
-                background: #eef4fc;
-                color: #365070;
-                border: none;
-                border-right: 1px solid #d7e2f0;
-                border-bottom: 1px solid #d7e2f0;
-                padding: 8px;
-                font-weight: 700;
-            }
-            QTableWidget QScrollBar:vertical {
-                background: #eef4fc;
-                width: 12px;
-                border-radius: 6px;
-                margin: 4px;
-            }
-            QTableWidget QScrollBar::handle:vertical {
-                background: #b8cbe4;
-                border-radius: 6px;
-                min-height: 24px;
-            }
-            QTableWidget QScrollBar:horizontal {
-                background: #eef4fc;
-                height: 12px;
-                border-radius: 6px;
-                margin: 4px;
-            }
-            QTableWidget QScrollBar::handle:horizontal {
-                background: #b8cbe4;
-                border-radius: 6px;
-                min-width: 24px;
-            }
-            QTableWidget QScrollBar::add-line,
-            QTableWidget QScrollBar::sub-line {
-                width: 0px;
-                height: 0px;
-                border: none;
-                background: transparent;
-            }
-            """
-        if self.dark_mode:
-            dark_overrides = """
-            QWidget#root {
-                background: qlineargradient(
-                    x1: 0, y1: 0, x2: 1, y2: 1,
-                    stop: 0 #131a25,
-                    stop: 0.55 #161f2d,
-                    stop: 1 #1c2434
-                );
-            }
-            QFrame#headerCard, QFrame#card {
-                background-color: rgba(25, 34, 49, 232);
-                border: 1px solid #33445f;
-            }
-            QLabel {
-                color: #d4e3f8;
-            }
-            QLabel#titleLabel {
-                color: #ecf3ff;
-            }
-            QLabel#subtitleLabel {
-                color: #9eb3d3;
-            }
-            QLabel#fieldLabel {
-                color: #95abcf;
-            }
-            QLabel#platformChip {
-                border: 1px solid #3e5580;
-                background-color: #22314b;
-                color: #c5d9f7;
-            }
-            QLineEdit {
-                background: #1a2537;
-                border: 1px solid #3a4d70;
-                color: #d7e5fb;
-                selection-background-color: #2f71c8;
-            }
-            QLineEdit:focus {
-                border: 2px solid #4b8be1;
-            }
-            QComboBox {
-                background: #1a2537;
-                border: 1px solid #3a4d70;
-                color: #d7e5fb;
-            }
-            QComboBox::down-arrow {
-                border-top: 7px solid #9ab7de;
-            }
-            QComboBox QAbstractItemView {
-                border: 1px solid #3a4d70;
-                background: #1a2537;
-                color: #d7e5fb;
-                selection-background-color: #2b4872;
-                selection-color: #eaf3ff;
-            }
-            QComboBox QAbstractItemView::item {
-                background: #1a2537;
-                color: #d7e5fb;
-            }
-            QComboBox QAbstractItemView::item:selected {
-                background: #2b4872;
-                color: #eaf3ff;
-            }
-            QPushButton#primaryButton {
-                background-color: #2f6fd8;
-                color: #edf4ff;
-                border: 1px solid #245ebd;
-            }
-            QPushButton#primaryButton:hover {
-                background-color: #2866cb;
-            }
-            QPushButton#secondaryButton {
-                background-color: #1f2a3d;
-                color: #c6daf8;
-                border: 1px solid #3d5479;
-            }
-            QPushButton#secondaryButton:hover {
-                background-color: #24334a;
-            }
-            QPushButton#secondaryButton:checked {
-                background-color: #2a3f63;
-                color: #e7f0ff;
-                border: 1px solid #5781c2;
-            }
-            QPushButton#dangerButton {
-                background-color: #3a2227;
-                color: #ffb8b2;
-                border: 1px solid #774047;
-            }
-            QPushButton#dangerButton:hover {
-                background-color: #46282e;
-            }
-            QPushButton:disabled {
-                background-color: #1a2434;
-                color: #70839f;
-                border: 1px solid #2f3f57;
-            }
-            QLabel#statusPill {
-                color: #cde1ff;
-                background-color: #1f3553;
-                border: 1px solid #42638d;
-            }
-            QLabel#statusPill[state="active"] {
-                color: #cde1ff;
-                background-color: #22405f;
-                border: 1px solid #4d78a9;
-            }
-            QLabel#statusPill[state="success"] {
-                color: #c8f4d8;
-                background-color: #1e4733;
-                border: 1px solid #3e7a5e;
-            }
-            QLabel#statusPill[state="warning"] {
-                color: #ffe0b4;
-                background-color: #4d3a1f;
-                border: 1px solid #816637;
-            }
-            QLabel#statusPill[state="error"] {
-                color: #ffc8c2;
-                background-color: #54272b;
-                border: 1px solid #87454c;
-            }
-            QProgressBar {
-                border: 1px solid #415474;
-                background: #182234;
-            }
-            QProgressBar::chunk {
-                background: qlineargradient(
-                    x1: 0, y1: 0, x2: 1, y2: 0,
-                    stop: 0 #3ea8ff, stop: 1 #2f73db
-                );
-            }
-            QPlainTextEdit#logBox {
-                background-color: #172132;
-                border: 1px solid #374a68;
-                color: #d7e5fb;
-            }
-            QTableWidget {
-                background-color: #162131;
-                border: 1px solid #374a68;
-                gridline-color: #2e3f59;
-                alternate-background-color: #1a2739;
-                selection-background-color: #2b4872;
-                selection-color: #eaf3ff;
-                color: #d7e5fb;
-            }
-            QHeaderView::section {
-                background: #25344b;
-                color: #cde1ff;
-                border-right: 1px solid #374a68;
-                border-bottom: 1px solid #374a68;
-            }
-            QTableWidget QScrollBar:vertical {
-                background: #1d2b40;
-            }
-            QTableWidget QScrollBar::handle:vertical {
-                background: #4c658e;
-            }
-            QTableWidget QScrollBar:horizontal {
-                background: #1d2b40;
-            }
-            QTableWidget QScrollBar::handle:horizontal {
-                background: #4c658e;
-            }
-            """
-            self.setStyleSheet(base_styles + dark_overrides)
-        else:
-            self.setStyleSheet(base_styles)
+        self.setStyleSheet(_DARK_QSS if self.dark_mode else _LIGHT_QSS)
 
     def toggle_theme(self, checked: bool) -> None:
         self.dark_mode = checked
@@ -777,10 +1241,16 @@ class MainWindow(QMainWindow):
         self.apply_styles()
 
     def set_status(self, message: str, state: str) -> None:
-        self.status_label.setText(message)
-        self.status_label.setProperty("state", state)
-        self.style().unpolish(self.status_label)
-        self.style().polish(self.status_label)
+        if message != self._last_status_text:
+            self._last_status_text = message
+            self.status_label.setText(message)
+        # Re-polishing recomputes the label's style, so only do it when the
+        # state property that the stylesheet keys on has changed.
+        if state != self._last_status_state:
+            self._last_status_state = state
+            self.status_label.setProperty("state", state)
+            self.style().unpolish(self.status_label)
+            self.style().polish(self.status_label)
 
     def showEvent(self, event) -> None:  # type: ignore[override]
         super().showEvent(event)
@@ -817,75 +1287,66 @@ class MainWindow(QMainWindow):
             return
 
         quality = self.quality_combo.currentText()
-        urls = [line.strip() for line in raw_text.splitlines() if line.strip()]
-
-        for url in urls:
-            self._append_queue_row(url, quality)
+        # One split over the whole paste, then ordered de-duplication and a
+        # filter against what is already queued.
+        tokens = raw_text.split()
+        unique = list(dict.fromkeys(tokens))
+        queued = self._queued_urls
+        urls = [url for url in unique if url not in queued]
+        repeated = len(tokens) - len(unique)
+        skipped = len(unique) - len(urls)
+        queued.update(urls)
+
+        self._append_queue_rows(urls, quality)
 
         self.url_input.clear()
-        self.log_box.appendPlainText(f"Queued {len(urls)} item(s) with quality: {quality}")
+        if repeated:
+            self._append_log(f"Ignored {repeated} repeated URL(s) in the input.")
+        if skipped:
+            self._append_log(f"Skipped {skipped} URL(s) already in the queue.")
+        self._append_log(f"Queued {len(urls)} item(s) with quality: {quality}")
         self.set_status(f"Added {len(urls)} item(s) to queue.", "idle")
         self._update_queue_buttons()
 
-    def _append_queue_row(self, url: str, quality: str) -> None:
-        row = self.queue_table.rowCount()
-        self.queue_table.insertRow(row)
-        self._set_row_text(row, self.COL_URL, url)
-        quality_combo = self._build_row_quality_combo(quality)
-        self.queue_table.setCellWidget(row, self.COL_QUALITY, quality_combo)
-        self._set_row_text(row, self.COL_STATUS, "Queued")
-        self._set_row_text(row, self.COL_PROGRESS, "0%")
-
-    def _build_row_quality_combo(self, quality: str) -> QComboBox:
-        combo = QComboBox()
-        combo.addItems(list(QUALITY_PRESETS.keys()))
-        combo.setCurrentText(quality if quality in QUALITY_PRESETS else "Best (Video + Audio)")
-        combo.setProperty("tableQuality", True)
-        return combo
+    def _append_queue_rows(self, urls: list[str], quality: str) -> None:
+        if not urls:
+            return
+        if quality not in _QUALITY_KEYS_SET:
+            quality = _DEFAULT_QUALITY
+        base = self.queue_model.rowCount()
+        # One beginInsertRows/endInsertRows pair announces the whole batch.
+        self.queue_model.append_entries(
+            [QueueEntry(url, quality, host=urlparse(url).netloc.lower()) for url in urls]
+        )
+        self._pending_rows.extend(range(base, base + len(urls)))
 
     def _quality_for_row(self, row: int) -> str:
-        widget = self.queue_table.cellWidget(row, self.COL_QUALITY)
-        if isinstance(widget, QComboBox):
-            return widget.currentText()
-
-        quality_item = self.queue_table.item(row, self.COL_QUALITY)
-        if quality_item and quality_item.text() in QUALITY_PRESETS:
-            return quality_item.text()
-        return "Best (Video + Audio)"
+        quality = self.queue_model.entries[row].quality
+        return quality if quality in _QUALITY_KEYS_SET else _DEFAULT_QUALITY
 
     def _set_quality_editable(self, enabled: bool) -> None:
         self.quality_combo.setEnabled(enabled)
-        for row in range(self.queue_table.rowCount()):
-            widget = self.queue_table.cellWidget(row, self.COL_QUALITY)
-            if isinstance(widget, QComboBox):
-                widget.setEnabled(enabled)
-
-    def _set_row_text(self, row: int, column: int, text: str) -> None:
-        item = self.queue_table.item(row, column)
-        if item is None:
-            item = QTableWidgetItem(text)
-            self.queue_table.setItem(row, column, item)
-        else:
-            item.setText(text)
-
-        if column == self.COL_URL:
-            item.setToolTip(text)
-
-        if column in (self.COL_QUALITY, self.COL_STATUS, self.COL_PROGRESS):
-            item.setTextAlignment(Qt.AlignCenter)
+        self.quality_delegate.set_enabled(enabled)
 
     def _set_row_status(self, row: int, status: str) -> None:
-        self._set_row_text(row, self.COL_STATUS, status)
+        self.queue_model.set_status(row, status)
 
-    def _set_row_progress(self, row: int, text: str) -> None:
-        self._set_row_text(row, self.COL_PROGRESS, text)
+    def _set_row_progress(self, row: int, percent: int) -> None:
+        self.queue_model.set_progress(row, percent)
+
+    def _set_overall_progress(self, value: int) -> None:
+        if value != self._last_bar_value:
+            self._last_bar_value = value
+            self.progress_bar.setValue(value)
 
     def _next_queued_row(self) -> int | None:
-        for row in range(self.queue_table.rowCount()):
-            item = self.queue_table.item(row, self.COL_STATUS)
-            if item and item.text() == "Queued":
-                return row
-        return None
+        return self._pending_rows[0] if self._pending_rows else None
+
+    def _rebuild_pending_rows(self) -> None:
+        # Row indices shift when rows are removed; recompute from the model.
+        self._pending_rows = deque(
+            row for row, entry in enumerate(self.queue_model.entries) if entry.status == "Queued"
+        )
 
     def start_queue(self) -> None:
         if self.queue_running:
@@ -899,145 +1360,315 @@ class MainWindow(QMainWindow):
             QMessageBox.information(self, "Queue Empty", "Add URLs to the queue first.")
             return
 
-        self.log_box.appendPlainText("Starting queue...")
+        self._append_log("Starting queue...")
         self.queue_running = True
         self.stop_queue_requested = False
-        self.progress_bar.setValue(0)
+        self._set_overall_progress(0)
+        self._batch_progress.clear()
+        self._status_prefix.clear()
+        self._log_prefix.clear()
+        self._validated_dirs.clear()
+        self._validated_cookies.clear()
         self._set_quality_editable(False)
-        self._update_queue_buttons()
-        self._start_next_item()
-
-    def _start_next_item(self) -> None:
-        if self.stop_queue_requested:
-            self._finish_queue("Queue stopped.", "warning")
-            return
-
-        next_row = self._next_queued_row()
-        if next_row is None:
+        self._prepare_job()
+        if not self._start_queued_items():
             self._finish_queue("Queue completed.", "success")
             return
+        self.cancel_button.setEnabled(True)
+        self.set_status(
+            f"Downloading {len(self.active_workers)} item(s), "
+            f"up to {self.pool.maxThreadCount()} at a time, "
+            f"{self.per_site_spin.value()} per site",
+            "active",
+        )
+        self._update_queue_buttons()
 
+    def _ensure_output_dir(self, output_dir: str) -> bool:
+        if output_dir in self._validated_dirs:
+            return True
+        try:
+            os.makedirs(output_dir, exist_ok=True)
+        except OSError:
+            # Let each worker retry and report the error on its own row.
+            return False
+        self._validated_dirs.add(output_dir)
+        return True
+
+    def _cookie_exists(self, cookie_file: str) -> bool:
+        exists = self._validated_cookies.get(cookie_file)
+        if exists is None:
+            exists = os.path.isfile(cookie_file)
+            self._validated_cookies[cookie_file] = exists
+        return exists
+
+    def _prepare_job(self) -> None:
         output_dir = self.output_input.text().strip()
         cookie_file = self.cookies_input.text().strip()
-        url_item = self.queue_table.item(next_row, self.COL_URL)
-        if url_item is None:
-            self._set_row_status(next_row, "Failed")
-            self._set_row_progress(next_row, "0%")
-            self.log_box.appendPlainText(f"[Item {next_row + 1}] Invalid queue entry.")
-            self._start_next_item()
+        # Shared by every worker started in this batch; the paths are checked
+        # once here instead of once per item inside the workers.
+        self._job = {
+            "output_dir": output_dir,
+            "cookie_file": cookie_file if cookie_file and self._cookie_exists(cookie_file) else "",
+            "concurrent_fragments": self.fragments_spin.value(),
+            "dir_exists": self._ensure_output_dir(output_dir),
+            "cookie_checked": True,
+        }
+
+    def _start_queued_items(self) -> int:
+        # Extraction runs ahead of the downloads by at most one site's worth
+        # of items; other rows for a busy site stay queued.
+        entries = self.queue_model.entries
+        limit = self.per_site_spin.value()
+        extracting = self._host_extracting
+        ready = self._ready
+        held: deque[int] = deque()
+        started = 0
+        for row in self._pending_rows:
+            host = entries[row].host
+            if extracting[host] + len(ready[host]) >= limit:
+                held.append(row)
+                continue
+            extracting[host] += 1
+            self._start_item(row)
+            started += 1
+        self._pending_rows = held
+        return started
+
+    def _start_ready_downloads(self, host: str) -> None:
+        limit = self.per_site_spin.value()
+        ready = self._ready[host]
+        while ready and self._host_downloading[host] < limit:
+            row, info = ready.popleft()
+            self._start_download(row, info)
+
+    def _on_per_site_changed(self, _value: int) -> None:
+        if not self.queue_running or self.stop_queue_requested:
             return
-
-        url = url_item.text()
-        quality = self._quality_for_row(next_row)
-        self.current_row = next_row
-
-        self._set_row_status(next_row, "Downloading")
-        self._set_row_progress(next_row, "0%")
-        self.progress_bar.setValue(0)
-        self.set_status(
-            f"Downloading item {next_row + 1}/{self.queue_table.rowCount()} ({quality})",
-            "active",
+        for host in list(self._ready):
+            self._start_ready_downloads(host)
+        self._start_queued_items()
+
+    def _connect_worker(self, signals: DownloadSignals) -> None:
+        # Worker signals are emitted from pool threads; pin them to queued
+        # connections so Qt posts them to the GUI thread without an affinity
+        # check per emit, and so they are never invoked directly.
+        signals.info_ready.connect(self.on_info_ready, Qt.QueuedConnection)
+        signals.started.connect(self.on_item_started, Qt.QueuedConnection)
+        signals.progress.connect(self.on_progress, Qt.QueuedConnection)
+        signals.log.connect(self.on_log, Qt.QueuedConnection)
+        signals.finished.connect(self.on_item_finished, Qt.QueuedConnection)
+
+    def _start_item(self, row: int) -> None:
+        worker = InfoWorker(
+            row,
+            self.queue_model.entries[row].url,
+            self.worker_signals,
+            self._job["cookie_file"],
+            quality_preset=self._quality_for_row(row),
         )
+        self.active_workers[row] = worker
+        self._batch_progress[row] = 0.0
+        self._status_prefix[row] = f"Item {row + 1}: "
+        self._log_prefix[row] = f"[Item {row + 1}] "
+        self._set_row_status(row, "Waiting")
+        self._set_row_progress(row, 0)
+        self.info_pool.start(worker)
+
+    def on_info_ready(self, row: int, info: dict) -> None:
+        if row not in self.active_workers:
+            return
+        host = self.queue_model.entries[row].host
+        self._host_extracting[host] -= 1
+        self.active_workers[row] = None
+        if self.stop_queue_requested:
+            self.on_item_finished(row, False, "Download canceled.")
+            return
 
-        self.thread = QThread()
-        self.worker = DownloadWorker(url, output_dir, cookie_file, quality)
-        self.worker.moveToThread(self.thread)
-
-        self.thread.started.connect(self.worker.run)
-        self.worker.progress.connect(self.on_progress)
-        self.worker.log.connect(self.on_log)
-        self.worker.finished.connect(self.on_item_finished)
-        self.worker.finished.connect(self.thread.quit)
-        self.worker.finished.connect(self.worker.deleteLater)
-        self.thread.finished.connect(self.on_thread_finished)
-        self.thread.finished.connect(self.thread.deleteLater)
-
-        self.cancel_button.setEnabled(True)
-        self.thread.start()
+        self._ready[host].append((row, info))
+        self._start_ready_downloads(host)
+        self._start_queued_items()
+
+    def _start_download(self, row: int, info: dict) -> None:
+        entry = self.queue_model.entries[row]
+        worker = DownloadWorker(
+            row,
+            entry.url,
+            info,
+            self.worker_signals,
+            quality_preset=self._quality_for_row(row),
+            **self._job,
+        )
+        self._host_downloading[entry.host] += 1
+        self.active_workers[row] = worker
+        self.pool.start(worker)
 
     def _finish_queue(self, message: str, state: str) -> None:
+        self._progress_timer.stop()
+        self._pending_progress.clear()
+        self._pending_status = None
         self.queue_running = False
         self.stop_queue_requested = False
-        self.current_row = None
         self.cancel_button.setEnabled(False)
-        self.progress_bar.setValue(100 if state == "success" else 0)
+        self._set_overall_progress(100 if state == "success" else 0)
         self.set_status(message, state)
-        self.log_box.appendPlainText(message)
+        self._append_log(message)
+        # Write the tail of the run together with the final status.
+        self._log_timer.stop()
+        self._flush_log()
         self._set_quality_editable(True)
         self._update_queue_buttons()
 
     def cancel_download(self) -> None:
-        if self.worker:
+        if self.active_workers:
             self.stop_queue_requested = True
-            self.worker.cancel()
-            self.set_status("Cancelling current item...", "warning")
-            self.log_box.appendPlainText("Cancel requested...")
+            for worker in self.active_workers.values():
+                if worker is not None:
+                    worker.cancel()
+            self.set_status("Cancelling active downloads...", "warning")
+            self._append_log("Cancel requested...")
             self.cancel_button.setEnabled(False)
+            # Items waiting for a site slot have no worker to stop.
+            waiting = [row for ready in self._ready.values() for row, _info in ready]
+            self._ready.clear()
+            for row in waiting:
+                self.on_item_finished(row, False, "Download canceled.")
         elif self.queue_running:
             self.stop_queue_requested = True
             self.set_status("Stopping queue...", "warning")
 
-    def on_progress(self, percent: float, message: str) -> None:
-        row = self.current_row
-        self.progress_bar.setValue(max(0, min(100, int(percent))))
-        if row is not None:
-            self._set_row_progress(row, f"{percent:.1f}%")
-            self.set_status(f"Item {row + 1}: {message}", "active")
-        else:
-            self.set_status(message, "active")
+    def on_item_started(self, row: int) -> None:
+        self._set_row_status(row, "Downloading")
 
-    def on_log(self, message: str) -> None:
-        row = self.current_row
-        prefix = f"[Item {row + 1}] " if row is not None else ""
-        self.log_box.appendPlainText(f"{prefix}{message}")
+    def on_progress(self, row: int, percent: int, message: str) -> None:
+        # Each worker already throttles itself, but several running at once
+        # still add up; keep only the latest value per row and apply them
+        # together on the next flush.
+        self._pending_progress[row] = percent
+        self._pending_status = (row, message)
+        if not self._progress_timer.isActive():
+            self._progress_timer.start()
 
-    def on_item_finished(self, success: bool, message: str) -> None:
-        row = self.current_row
-        if row is None:
-            self.log_box.appendPlainText(message)
+    def _flush_progress(self) -> None:
+        if not self._pending_progress:
+            return
+        for row, percent in self._pending_progress.items():
+            self._batch_progress[row] = percent
+            self._set_row_progress(row, percent)
+        self._pending_progress.clear()
+        overall = sum(self._batch_progress.values()) / len(self._batch_progress)
+        self._set_overall_progress(max(0, min(100, int(overall))))
+        if self._pending_status is not None:
+            row, message = self._pending_status
+            self._pending_status = None
+            self.set_status(self._status_prefix[row] + message, "active")
+
+    def _take_pending_progress(self, row: int) -> int | None:
+        if self._pending_status is not None and self._pending_status[0] == row:
+            self._pending_status = None
+        return self._pending_progress.pop(row, None)
+
+    def on_log(self, row: int, message: str) -> None:
+        self._append_log(self._log_prefix[row] + message)
+
+    def _append_log(self, message: str) -> None:
+        # Lines are collected and written in one append per flush interval, so
+        # a burst of worker messages costs a single document relayout.
+        self._log_buffer.append(message)
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+
+    def _flush_log(self) -> None:
+        if not self._log_buffer:
             return
+        batch = "\n".join(self._log_buffer)
+        self._log_buffer.clear()
+        self.log_box.appendPlainText(batch)
+
+    def on_item_finished(self, row: int, success: bool, message: str) -> None:
+        entry = self.queue_model.entries[row]
+        worker = self.active_workers.pop(row, None)
+        if isinstance(worker, DownloadWorker):
+            self._host_downloading[entry.host] -= 1
+        elif isinstance(worker, InfoWorker):
+            self._host_extracting[entry.host] -= 1
+        # A deferred update must not overwrite the final row state.
+        last_percent = self._take_pending_progress(row)
+        requeued = False
 
         lowered = message.lower()
         if success:
             row_status = "Done"
             state = "success"
-            progress_text = "100%"
+            self._set_row_progress(row, 100)
         elif "cancel" in lowered:
-            row_status = "Canceled"
             state = "warning"
-            current_progress = self.queue_table.item(row, self.COL_PROGRESS)
-            progress_text = current_progress.text() if current_progress else "0%"
             self.stop_queue_requested = True
+            if entry.status == "Downloading":
+                row_status = "Canceled"
+                # Keep the row at the last percent the worker reported.
+                if last_percent is not None:
+                    self._set_row_progress(row, last_percent)
+            else:
+                # The item was stopped before its download began, so it goes
+                # back to the queue for the next run.
+                row_status = "Queued"
+                requeued = True
+                message = "Canceled before starting; returned to the queue."
+                self._set_row_progress(row, 0)
         else:
             row_status = "Failed"
             state = "error"
-            progress_text = "0%"
+            self._set_row_progress(row, 0)
 
+        if requeued:
+            self._batch_progress.pop(row, None)
+        else:
+            self._batch_progress[row] = 100.0
+            # Finished items may be queued again.
+            self._queued_urls.discard(entry.url)
         self._set_row_status(row, row_status)
-        self._set_row_progress(row, progress_text)
         self.set_status(message, state)
-        self.log_box.appendPlainText(f"[Item {row + 1}] {message}")
-        self._update_queue_buttons()
+        self._append_log(self._log_prefix[row] + message)
 
-    def on_thread_finished(self) -> None:
-        self.worker = None
-        self.thread = None
-        self.current_row = None
-        self.cancel_button.setEnabled(False)
         if self.queue_running:
-            self._start_next_item()
+            if self.stop_queue_requested:
+                if not self.active_workers:
+                    self._rebuild_pending_rows()
+                    self._finish_queue("Queue stopped.", "warning")
+                    return
+            else:
+                if not self.active_workers:
+                    # Rows added while the last batch ran start a new batch.
+                    self._prepare_job()
+                self._start_ready_downloads(entry.host)
+                self._start_queued_items()
+                if not self.active_workers:
+                    self._finish_queue("Queue completed.", "success")
+                    return
+        self._update_queue_buttons()
 
     def remove_selected_items(self) -> None:
         if self.queue_running:
             QMessageBox.information(self, "Queue Running", "Stop the queue before removing items.")
             return
 
-        selected_rows = sorted({index.row() for index in self.queue_table.selectedIndexes()}, reverse=True)
+        selected_rows = sorted(
+            (index.row() for index in self.queue_table.selectionModel().selectedRows()),
+            reverse=True,
+        )
         if not selected_rows:
             return
 
+        # _queued_urls only holds URLs of unfinished rows, and there is at most
+        # one of those per URL. Removing a finished row must leave a re-added
+        # copy of the same URL in place.
+        entries = self.queue_model.entries
         for row in selected_rows:
-            self.queue_table.removeRow(row)
+            entry = entries[row]
+            if entry.status not in _FINISHED_STATES:
+                self._queued_urls.discard(entry.url)
+        self._remove_rows(selected_rows)
+        self._rebuild_pending_rows()
 
         self.set_status(f"Removed {len(selected_rows)} item(s).", "idle")
         self._update_queue_buttons()
@@ -1047,37 +1678,66 @@ class MainWindow(QMainWindow):
             QMessageBox.information(self, "Queue Running", "Stop the queue before clearing items.")
             return
 
-        removable = []
-        for row in range(self.queue_table.rowCount()):
-            status_item = self.queue_table.item(row, self.COL_STATUS)
-            if status_item and status_item.text() in {"Done", "Failed", "Canceled"}:
-                removable.append(row)
-
-        for row in reversed(removable):
-            self.queue_table.removeRow(row)
-
+        removable = [
+            row
+            for row, entry in enumerate(self.queue_model.entries)
+            if entry.status in _FINISHED_STATES
+        ]
         if removable:
+            removable.reverse()
+            self._remove_rows(removable)
+            self._rebuild_pending_rows()
             self.set_status(f"Cleared {len(removable)} finished item(s).", "idle")
 
         self._update_queue_buttons()
 
+    def _remove_rows(self, rows: list[int]) -> None:
+        """Remove rows given in descending order, one model call per contiguous run."""
+        table = self.queue_table
+        table.setUpdatesEnabled(False)
+        try:
+            index = 0
+            while index < len(rows):
+                last = rows[index]
+                first = last
+                index += 1
+                while index < len(rows) and rows[index] == first - 1:
+                    first -= 1
+                    index += 1
+                # Each call fires selectionChanged; _update_queue_buttons
+                # folds the burst into one refresh on the next loop pass.
+                self.queue_model.removeRows(first, last - first + 1)
+        finally:
+            table.setUpdatesEnabled(True)
+
     def _update_queue_buttons(self) -> None:
-        has_rows = self.queue_table.rowCount() > 0
+        # Bursts of row/selection changes collapse into one refresh on the
+        # next event loop pass.
+        if not self._buttons_timer.isActive():
+            self._buttons_timer.start()
+
+    def _update_queue_buttons_now(self) -> None:
+        has_rows = self.queue_model.rowCount() > 0
         has_queued = self._next_queued_row() is not None
-        has_selection = bool(self.queue_table.selectedIndexes())
+        has_selection = self.queue_table.selectionModel().hasSelection()
 
         self.start_button.setEnabled(has_queued and not self.queue_running)
-        self.cancel_button.setEnabled(self.queue_running and self.worker is not None)
+        self.cancel_button.setEnabled(
+            self.queue_running and bool(self.active_workers) and not self.stop_queue_requested
+        )
         self.remove_button.setEnabled(has_selection and not self.queue_running)
         self.clear_finished_button.setEnabled(has_rows and not self.queue_running)
 
     def closeEvent(self, event) -> None:  # type: ignore[override]
-        if self.worker:
+        # active_workers only holds items that have not reported back yet, so
+        # an idle window closes without touching the pools.
+        if self.active_workers:
             self.stop_queue_requested = True
-            self.worker.cancel()
-        if self.thread and self.thread.isRunning():
-            self.thread.quit()
-            self.thread.wait(2000)
+            for worker in self.active_workers.values():
+                if worker is not None:
+                    worker.cancel()
+            for pool in (self.info_pool, self.pool):
+                pool.waitForDone(2000)
         super().closeEvent(event)
 
 